@@ -2,23 +2,30 @@
 import streamlit as st
 from io import BytesIO
 from datetime import datetime
+from functools import lru_cache, partial
 import re
+from typing import NamedTuple
+from xml.sax.saxutils import escape as xml_escape
 
 # ---- ReportLab (PDF) ----
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Image, ListFlowable, ListItem, KeepTogether, Table, TableStyle
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Image
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.units import inch
 from reportlab.lib.colors import lightgrey, Color, black, HexColor
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab import rl_config
+
+rl_config.shapeChecking = 0  # skip per-attribute validation on graphics objects
 
 # ---- python-docx (DOCX) ----
 from docx import Document
 from docx.shared import Inches, Pt
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
 
 # ---- PIL for image overlay (month/year on top image) ----
 from PIL import Image as PILImage, ImageDraw, ImageFont
@@ -26,27 +33,60 @@ from PIL import Image as PILImage, ImageDraw, ImageFont
 # =========================================================
 # Helpers
 # =========================================================
+def _has_link_syntax(text: str) -> bool:
+    """
+    Cheap substring check: False means none of the link patterns below can match.
+    """
+    return '[' in text or 'http' in text or 'mailto:' in text or '@' in text
+
+
+# Link patterns are compiled once at import; they run for every intro, bullet and contact block.
+_COMBINED_RE = re.compile(
+    r'\[(?P<mdtxt>[^\]]+)\]\((?P<mdurl>[^)]+)\)|(?P<url>https?://\S+)|(?P<mailto>mailto:\S+)'
+    r'|(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})'
+)
+# href prefix per bare-link group: only plain email addresses need a mailto: scheme
+_LINK_HREF_PREFIX = {'url': '', 'mailto': '', 'email': 'mailto:'}
+# PDF text is ReportLab markup: existing <a>...</a> spans are matched first and passed through untouched
+_PDF_LINK_RE = re.compile(
+    r'(?P<anchor><a\s[^>]*>.*?</a>)|' + _COMBINED_RE.pattern,
+    re.DOTALL
+)
+
+
+def _pdf_link_repl(m) -> str:
+    """
+    Replacement for a _PDF_LINK_RE match: keep anchors, convert [text](url) and bare URLs/emails to <a>.
+    """
+    kind = m.lastgroup  # 'anchor', 'mdurl' (markdown link), 'url', 'mailto' or 'email'
+    if kind == 'anchor':
+        return m.group(0)
+    if kind == 'mdurl':
+        return f'<a href="{m.group("mdurl")}" color="blue">{m.group("mdtxt")}</a>'
+    link = m.group(kind)
+    return f'<a href="{_LINK_HREF_PREFIX[kind]}{link}" color="blue">{link}</a>'
+
+
+@lru_cache(maxsize=512)
 def process_content_pdf(content: str) -> str:
     """
     Convert [text](url) to <a> for PDF; also auto-link urls/emails.
     """
     if not content:
         return ""
-    # Convert markdown-style links to <a>
-    processed = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2" color="blue">\1</a>', content)
-
-    # Auto-link plain URLs and emails (avoid double-wrapping by excluding content inside <a> tags)
-    url_pattern = re.compile(
-        r'(?<!href=")(?!.*</a>)(https?://\S+|mailto:\S+|\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})(?!")(?![^<]*</a>)'
-    )
+    if not _has_link_syntax(content):
+        return content
+    # One pass: markdown links and bare URLs/emails are rewritten by the same substitution
+    return _PDF_LINK_RE.sub(_pdf_link_repl, content)
 
-    def repl(m):
-        link = m.group(0)
-        if '@' in link and not link.startswith('mailto:'):
-            link = f'mailto:{link}'
-        return f'<a href="{link}" color="blue">{m.group(0)}</a>'
 
-    return re.sub(url_pattern, repl, processed)
+# Hyperlink run: blue + single underline. Built from one template so each link is a single parse.
+_HYPERLINK_XML = (
+    '<w:hyperlink %s r:id="{rid}" w:history="1">'
+    '<w:r><w:rPr><w:color w:val="0000FF"/><w:u w:val="single"/></w:rPr>'
+    '<w:t xml:space="preserve">{text}</w:t></w:r>'
+    '</w:hyperlink>'
+) % nsdecls('w', 'r')
 
 
 def add_hyperlink(paragraph, url, text=None):
@@ -61,29 +101,7 @@ def add_hyperlink(paragraph, url, text=None):
         'http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink',
         is_external=True
     )
-    hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
-    hyperlink.set(qn('w:history'), '1')
-
-    new_run = OxmlElement('w:r')
-    rPr = OxmlElement('w:rPr')
-
-    # Color blue
-    c = OxmlElement('w:color')
-    c.set(qn('w:val'), '0000FF')
-    rPr.append(c)
-
-    # Underline
-    u = OxmlElement('w:u')
-    u.set(qn('w:val'), 'single')
-    rPr.append(u)
-
-    new_run.append(rPr)
-    new_run_text = OxmlElement('w:t')
-    new_run_text.text = text
-    new_run.append(new_run_text)
-    hyperlink.append(new_run)
-    paragraph._p.append(hyperlink)
+    paragraph._p.append(parse_xml(_HYPERLINK_XML.format(rid=r_id, text=xml_escape(text))))
     return paragraph
 
 
@@ -93,30 +111,66 @@ def add_text_with_links(paragraph, text: str):
     """
     if not text:
         return
-    md = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
-    last_end = 0
-    for m in md.finditer(text):
-        paragraph.add_run(text[last_end:m.start()])
-        add_hyperlink(paragraph, m.group(2), m.group(1))
-        last_end = m.end()
-    tail = text[last_end:]
-
-    url_pattern = re.compile(r'(https?://\S+|mailto:\S+|\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})')
+    if not _has_link_syntax(text):
+        paragraph.add_run(text)
+        return
+    # Each add_run appends a <w:r> element, so only emit runs that carry text
     last_end = 0
-    for m in url_pattern.finditer(tail):
-        paragraph.add_run(tail[last_end:m.start()])
-        link = m.group(0)
-        if '@' in link and not link.startswith('mailto:'):
-            link = f'mailto:{link}'
-        add_hyperlink(paragraph, link, m.group(0))
+    for m in _COMBINED_RE.finditer(text):
+        if m.start() > last_end:
+            paragraph.add_run(text[last_end:m.start()])
+        if m.lastgroup == 'mdurl':
+            add_hyperlink(paragraph, m.group('mdurl'), m.group('mdtxt'))
+        else:
+            link = m.group(m.lastgroup)
+            add_hyperlink(paragraph, _LINK_HREF_PREFIX[m.lastgroup] + link, link)
         last_end = m.end()
-    paragraph.add_run(tail[last_end:])
+    if last_end < len(text):
+        paragraph.add_run(text[last_end:])
 
 
+@lru_cache(maxsize=512)
 def text_to_bullets(text: str):
+    # Cached, so return an immutable tuple
     if not text:
-        return []
-    return [line.strip() for line in text.splitlines() if line.strip()]
+        return ()
+    return tuple(s for s in map(str.strip, text.splitlines()) if s)
+
+
+class SectionModel(NamedTuple):
+    title: str
+    bullets: tuple       # raw bullet lines (DOCX)
+    bullets_html: tuple  # same bullets run through process_content_pdf (PDF)
+
+
+class NewsletterModel(NamedTuple):
+    intro_text: str
+    intro_html: str
+    sections: tuple      # one SectionModel per UI section, in order
+    contact_info: str
+    contact_html: str
+
+
+def _prepare_newsletter_model(intro_text, sections, contact_info) -> NewsletterModel:
+    """
+    Normalize the UI input once (strip, split bullets, linkify for PDF);
+    create_pdf and create_docx both consume the result.
+    """
+    section_models = []
+    for sec in sections:
+        bullets = text_to_bullets((sec.get("content") or "").strip())
+        section_models.append(SectionModel(
+            title=(sec.get("title") or "").strip(),
+            bullets=bullets,
+            bullets_html=tuple(process_content_pdf(b) for b in bullets),
+        ))
+    return NewsletterModel(
+        intro_text=intro_text or "",
+        intro_html=process_content_pdf(intro_text),
+        sections=tuple(section_models),
+        contact_info=contact_info or "",
+        contact_html=process_content_pdf(contact_info),
+    )
 
 
 COLOR_OPTIONS = {
@@ -127,6 +181,8 @@ COLOR_OPTIONS = {
     "Light Pink": Color(0.98, 0.90, 0.95),
     "Light Yellow": Color(0.98, 0.98, 0.85)
 }
+_COLOR_NAMES = tuple(COLOR_OPTIONS.keys())
+_COLOR_RGB = {name: color.rgb() for name, color in COLOR_OPTIONS.items()}  # hashable values for the cached generators
 
 # =========================================================
 # Page decorations for PDF
@@ -145,100 +201,182 @@ def draw_page_frame(canv, doc, headers, footers, draw_confidential=False, confid
     canv.line(30, height - 40, width - 30, height - 40)  # top line
     canv.line(30, 40, width - 30, 40)                    # bottom line
 
-    # Header/Footer text
-    canv.setFont("Helvetica", 9)
+    # Header/Footer text: one text object (a single BT...ET block) for all strings
+    text = canv.beginText()
+    text.setFont("Helvetica", 9)
     # Header
     if headers.get('top_left'):
-        canv.drawString(40, height - 30, headers['top_left'])
+        text.setTextOrigin(40, height - 30)
+        text.textOut(headers['top_left'])
     if headers.get('top_right'):
-        canv.drawRightString(width - 40, height - 30, headers['top_right'])
+        text.setTextOrigin(width - 40 - stringWidth(headers['top_right'], "Helvetica", 9), height - 30)
+        text.textOut(headers['top_right'])
     # Footer
     if footers.get('bottom_left'):
-        canv.drawString(40, 30, footers['bottom_left'])
+        text.setTextOrigin(40, 30)
+        text.textOut(footers['bottom_left'])
     if footers.get('bottom_right'):
-        canv.drawRightString(width - 40, 30, footers['bottom_right'])
+        text.setTextOrigin(width - 40 - stringWidth(footers['bottom_right'], "Helvetica", 9), 30)
+        text.textOut(footers['bottom_right'])
 
     # Confidentiality (first page only, centered near bottom)
     if draw_confidential and confidentiality_line:
-        canv.setFont("Helvetica-Oblique", 8)
-        canv.drawCentredString(width / 2.0, 50, confidentiality_line)
+        text.setFont("Helvetica-Oblique", 8)
+        text.setTextOrigin(width / 2.0 - stringWidth(confidentiality_line, "Helvetica-Oblique", 8) / 2.0, 50)
+        text.textOut(confidentiality_line)
+    canv.drawText(text)
 
     # Optional watermark across page
     if draw_watermark:
+        draw_watermark_form(canv, width, height)
+
+    canv.restoreState()
+
+
+_WATERMARK_FORM = "NewsletterWatermark"
+
+
+def draw_watermark_form(canv, width, height):
+    """
+    Draw the diagonal 'NEWSLETTER' watermark. The rotated text is recorded once per document
+    as a form XObject; every page then only references it.
+    """
+    if not canv.hasForm(_WATERMARK_FORM):
+        canv.beginForm(_WATERMARK_FORM)
         canv.setFont("Helvetica", 48)
-        canv.setFillGray(0.9, 0.3)  # light watermark
-        canv.saveState()
         canv.translate(width / 2.0, height / 2.0)
         canv.rotate(45)
         canv.drawCentredString(0, 0, "NEWSLETTER")
-        canv.restoreState()
-
-    canv.restoreState()
+        canv.endForm()
+    # Fill/alpha are set on the page: the form inherits them, and ReportLab does not
+    # register alpha (ExtGState) resources on forms.
+    canv.setFillGray(0.9, 0.3)  # light watermark
+    canv.doForm(_WATERMARK_FORM)
+
+
+# Page geometry is fixed, so the content frame's position and size are computed once
+_PDF_MARGINS = {"leftMargin": 50, "rightMargin": 50, "topMargin": 70, "bottomMargin": 70}
+_PDF_CONTENT_WIDTH = A4[0] - _PDF_MARGINS["leftMargin"] - _PDF_MARGINS["rightMargin"]
+_PDF_FRAME = (  # x, y, width, height
+    _PDF_MARGINS["leftMargin"],
+    _PDF_MARGINS["bottomMargin"],
+    _PDF_CONTENT_WIDTH,
+    A4[1] - _PDF_MARGINS["topMargin"] - _PDF_MARGINS["bottomMargin"],
+)
 
 
 def build_pdf(story, headers, footers, confidentiality_line, add_watermark):
     """
     Build the PDF with consistent frames on all pages and confidentiality line on first page only.
+    Returns the PDF as bytes.
     """
     buf = BytesIO()
-    doc = SimpleDocTemplate(buf, pagesize=A4, leftMargin=50, rightMargin=50, topMargin=70, bottomMargin=70)
-
-    def _first(canv, doc_):
-        draw_page_frame(
-            canv, doc_, headers, footers,
-            draw_confidential=True,
-            confidentiality_line=confidentiality_line,
-            draw_watermark=add_watermark
-        )
+    doc = BaseDocTemplate(buf, pagesize=A4, invariant=1, pageCompression=1, **_PDF_MARGINS)
 
-    def _later(canv, doc_):
-        draw_page_frame(
-            canv, doc_, headers, footers,
-            draw_confidential=False,
-            confidentiality_line="",
-            draw_watermark=add_watermark
-        )
+    _first = partial(
+        draw_page_frame, headers=headers, footers=footers,
+        draw_confidential=True,
+        confidentiality_line=confidentiality_line,
+        draw_watermark=add_watermark
+    )
+    _later = partial(
+        draw_page_frame, headers=headers, footers=footers,
+        draw_confidential=False,
+        confidentiality_line="",
+        draw_watermark=add_watermark
+    )
 
-    doc.build(story, onFirstPage=_first, onLaterPages=_later)
-    buf.seek(0)
-    return buf
+    frame = Frame(*_PDF_FRAME, id="main")
+    doc.addPageTemplates([
+        PageTemplate(id="first", frames=[frame], onPage=_first, autoNextPageTemplate="later"),
+        PageTemplate(id="later", frames=[frame], onPage=_later),
+    ])
+    doc.build(story)
+    return buf.getvalue()
 
 # =========================================================
 # Image utilities
 # =========================================================
+_IMAGE_DPI = 150  # target raster resolution for embedded images
+_IMAGE_MAX_W_PX = int(_PDF_CONTENT_WIDTH / 72 * _IMAGE_DPI)  # both formats use the same text width
+
+
+def _downscale(data: bytes, max_w_px: int, max_h_px: int) -> bytes:
+    """
+    Shrink an uploaded image to at most max_w_px x max_h_px before embedding.
+    ReportLab and python-docx embed pixel data as-is, so full-size photos bloat the output.
+    Both formats stretch the image to fill a fixed box, so each axis is capped separately
+    (keeping the aspect ratio would leave the other axis below the target resolution).
+    Called once per upload per click, so the PDF and DOCX builds share one decode; returns bytes
+    and falls back to the original bytes if the image is already small or unreadable.
+    """
+    try:
+        im = PILImage.open(BytesIO(data))
+        if im.width <= max_w_px and im.height <= max_h_px:
+            return data
+        im = im.resize((min(im.width, max_w_px), min(im.height, max_h_px)), PILImage.LANCZOS)
+        out = BytesIO()
+        if im.mode in ("RGB", "L"):
+            im.save(out, format="JPEG", optimize=True, quality=85)
+        else:
+            if im.mode not in ("RGBA", "LA", "P"):
+                im = im.convert("RGBA")
+            im.save(out, format="PNG", optimize=True)
+        return out.getvalue()
+    except Exception:
+        return data
+
+
+# Font for the month/year overlay (default if no TTF available)
+try:
+    _OVERLAY_FONT = ImageFont.truetype("arial.ttf", 28)
+except Exception:
+    _OVERLAY_FONT = ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def _overlay_text_size(text: str):
+    """
+    Width/height of overlay text in _OVERLAY_FONT (month/year strings repeat, so cache them).
+    """
+    bbox = ImageDraw.Draw(PILImage.new("L", (1, 1))).textbbox((0, 0), text, font=_OVERLAY_FONT)
+    return bbox[2], bbox[3]
+
+
 def overlay_month_year_on_image(file, month: str, year: str):
     """
     Overlays 'Month Year' text on the top-right of the uploaded image.
     Returns a BytesIO object for ReportLab Image.
     """
     try:
-        img = PILImage.open(file).convert("RGBA")
+        img = PILImage.open(file)
+        # Only pay for an alpha channel (and PNG encode) when the source actually has transparency
+        use_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+        img = img.convert("RGBA" if use_alpha else "RGB")
+        save_kwargs = {"format": "PNG"} if use_alpha else {"format": "JPEG", "quality": 88}
         draw = ImageDraw.Draw(img)
 
         text = f"{month} {year}".strip()
         if not text:
             bio = BytesIO()
-            img.save(bio, format="PNG")
+            img.save(bio, **save_kwargs)
             bio.seek(0)
             return bio
 
-        # Choose a font (default if no TTF available)
-        try:
-            font = ImageFont.truetype("arial.ttf", 28)
-        except:
-            font = ImageFont.load_default()
-
-        text_w, text_h = draw.textbbox((0, 0), text, font=font)[2:]
+        font = _OVERLAY_FONT
+        text_w, text_h = _overlay_text_size(text)
         pad = 10
         x = img.width - text_w - 2 * pad - 10
         y = 10
-        # semi-opaque white box behind text for readability
-        box = (x, y, x + text_w + 2 * pad, y + text_h + 2 * pad)
-        draw.rectangle(box, fill=(255, 255, 255, 180))
-        draw.text((x + pad, y + pad), text, fill=(0, 0, 0, 255), font=font)
+        # semi-opaque white box behind text for readability (blend only the box region)
+        box = (int(x), y, int(x + text_w + 2 * pad), int(y + text_h + 2 * pad))
+        region = img.crop(box)
+        white = PILImage.new(img.mode, region.size, (255,) * len(img.getbands()))
+        img.paste(PILImage.blend(region, white, 180 / 255), box[:2])
+        draw.text((x + pad, y + pad), text, fill=(0, 0, 0, 255) if use_alpha else (0, 0, 0), font=font)
 
         out = BytesIO()
-        img.save(out, format="PNG")
+        img.save(out, **save_kwargs)
         out.seek(0)
         return out
     except Exception:
@@ -252,83 +390,80 @@ def overlay_month_year_on_image(file, month: str, year: str):
 # =========================================================
 # PDF Generation
 # =========================================================
-def create_pdf(top_image_file, intro_text, intro_color, sections, contact_info, bottom_image_file,
-               headers, footers, confidentiality_line, add_watermark):
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # Calculate content width (A4 width - left margin - right margin)
-    content_width = A4[0] - 100  # 50 left + 50 right margin = 100
+# Stylesheet and base styles are immutable once built, so share them across renders
+_STYLES = getSampleStyleSheet()
+_INTRO_STYLE = ParagraphStyle("Intro", parent=_STYLES["Normal"], leading=14, spaceAfter=12, borderPadding=10)
+_SECTION_STYLE = ParagraphStyle("Section", parent=_STYLES["Normal"], leading=14, spaceAfter=12, borderPadding=10)
+_CONTACT_STYLE = ParagraphStyle("ContactStyle", parent=_STYLES["Normal"], leading=14, spaceAfter=12)
+_BACKGROUND_BASES = {"Intro": _INTRO_STYLE, "Section": _SECTION_STYLE}
+
+
+@lru_cache(maxsize=32)
+def _background_style(base: str, rgb: tuple) -> ParagraphStyle:
+    """
+    _INTRO_STYLE/_SECTION_STYLE with the given background; sections sharing a color share one style.
+    """
+    return _BACKGROUND_BASES[base].clone(f"{base}{rgb}", backColor=Color(*rgb))
+
+
+def _iter_story(top_image_bytes, model, intro_color, section_colors, bottom_image_bytes):
+    """
+    Yield the PDF flowables in document order.
+    """
+    content_width = _PDF_CONTENT_WIDTH
 
     # Top image
-    if top_image_file is not None:
-        top_image_file.seek(0)
-        img_io = BytesIO(top_image_file.read())
-        img_io.seek(0)
-        story.append(Image(img_io, width=content_width, height=2 * inch))
-        story.append(Spacer(1, 0.25 * inch))
+    if top_image_bytes is not None:
+        top_io = BytesIO(top_image_bytes)
+        yield Image(top_io, width=content_width, height=2 * inch)
+        yield Spacer(1, 0.25 * inch)
 
     # Intro block with colored background
-    if intro_text:
-        intro_style = ParagraphStyle(
-            "Intro",
-            parent=styles["Normal"],
-            backColor=intro_color,
-            leading=14,
-            spaceAfter=12,
-            borderPadding=10
-        )
-        story.append(Paragraph(process_content_pdf(intro_text), intro_style))
-        story.append(Spacer(1, 0.2 * inch))
-
-    # Sections
-    for i, sec in enumerate(sections, start=1):
-        title = (sec.get("title") or "").strip()
-        content = (sec.get("content") or "").strip()
-        section_color = sec.get("color", Color(1, 1, 1))
-
-        bullets = text_to_bullets(content)
-        if title or bullets:
-            section_content = []
-            
-            if title:
-                section_content.append(Paragraph(f"<b>{title}</b>", styles["Heading2"]))
-                section_content.append(Spacer(1, 0.05 * inch))
-            
-            if bullets:
-                bullet_style = ParagraphStyle(f"BulletStyle{i}", parent=styles["Normal"], leading=14, spaceBefore=0, spaceAfter=28, bulletFontSize=8)
-                items = [ListItem(Paragraph(process_content_pdf(b), bullet_style), leftIndent=12) for b in bullets]
-                section_content.append(ListFlowable(items, bulletType='bullet', start='circle', leftIndent=18, bulletFontSize=8))
-            
-            # Create single paragraph with section background
-            if title and bullets:
-                combined_text = f"<b>{title}</b><br/><br/>" + "<br/><br/>".join([f"• {process_content_pdf(b)}" for b in bullets])
-            elif title:
-                combined_text = f"<b>{title}</b>"
-            else:
-                combined_text = "<br/><br/>".join([f"• {process_content_pdf(b)}" for b in bullets])
-            
-            section_style = ParagraphStyle(f"Section{i}", parent=styles["Normal"], leading=14, spaceAfter=12, backColor=section_color, borderPadding=10)
-            story.append(Paragraph(combined_text, section_style))
-            # Use 2-line spacing for last 4 sections
-            spacing = 0.3 * inch if i > len(sections) - 4 else 0.15 * inch
-            story.append(Spacer(1, spacing))
+    if model.intro_text:
+        yield Paragraph(model.intro_html, _background_style("Intro", intro_color))
+        yield Spacer(1, 0.2 * inch)
+
+    # Sections (styles are shared per background color)
+    for i, (sec, rgb) in enumerate(zip(model.sections, section_colors), start=1):
+        title = sec.title
+        bullets = sec.bullets_html
+        if not (title or bullets):
+            continue
+
+        # Create single paragraph with section background
+        bullet_text = "• " + "<br/><br/>• ".join(bullets) if bullets else ""
+        if title and bullets:
+            combined_text = f"<b>{title}</b><br/><br/>" + bullet_text
+        elif title:
+            combined_text = f"<b>{title}</b>"
+        else:
+            combined_text = bullet_text
+
+        yield Paragraph(combined_text, _background_style("Section", rgb))
+        # Use 2-line spacing for last 4 sections
+        spacing = 0.3 * inch if i > len(model.sections) - 4 else 0.15 * inch
+        yield Spacer(1, spacing)
 
     # Contact info
-    if contact_info:
-        story.append(Paragraph("<b>Contact Information</b>", styles["Heading2"]))
-        story.append(Spacer(1, 0.05 * inch))
-        contact_style = ParagraphStyle("ContactStyle", parent=styles["Normal"], leading=14, spaceAfter=12)
-        story.append(Paragraph(process_content_pdf(contact_info), contact_style))
+    if model.contact_info:
+        yield Paragraph("<b>Contact Information</b>", _STYLES["Heading2"])
+        yield Spacer(1, 0.05 * inch)
+        yield Paragraph(model.contact_html, _CONTACT_STYLE)
 
     # Bottom image
-    if bottom_image_file is not None:
-        bottom_image_file.seek(0)
-        bio = BytesIO(bottom_image_file.read())
-        bio.seek(0)
-        story.append(Spacer(1, 0.3 * inch))
-        story.append(Image(bio, width=content_width, height=1 * inch))
+    if bottom_image_bytes is not None:
+        yield Spacer(1, 0.3 * inch)
+        bottom_io = BytesIO(bottom_image_bytes)
+        yield Image(bottom_io, width=content_width, height=1 * inch)
+
 
+# Inputs are plain bytes/str/(r, g, b) tuples so Streamlit can hash them; repeated
+# clicks with unchanged inputs skip the ReportLab build entirely.
+@st.cache_data(show_spinner=False, max_entries=8)
+def create_pdf(top_image_bytes, model, intro_color, section_colors, bottom_image_bytes,
+               headers, footers, confidentiality_line, add_watermark):
+    # ReportLab needs a list; the generator keeps construction in one place
+    story = list(_iter_story(top_image_bytes, model, intro_color, section_colors, bottom_image_bytes))
     return build_pdf(
         story=story,
         headers=headers,
@@ -340,13 +475,40 @@ def create_pdf(top_image_file, intro_text, intro_color, sections, contact_info,
 # =========================================================
 # DOCX Generation
 # =========================================================
-def create_docx(top_image_file, intro_text, sections, contact_info, bottom_image_file,
-                headers, footers):
-    doc = Document()
+def _blank_docx_bytes():
+    """
+    Serialize python-docx's default template once so each render loads it from memory.
+    """
+    bio = BytesIO()
+    Document().save(bio)
+    return bio.getvalue()
+
+
+_BLANK_DOCX_BYTES = _blank_docx_bytes()
+_DOCX_CONTENT_WIDTH_INCHES = _PDF_CONTENT_WIDTH / 72  # same text width as the PDF, in inches
+
+# Style ids resolved once: python-docx otherwise looks a style up by name (an XPath
+# scan of styles.xml) on every add_paragraph(style=...) / add_heading call.
+_blank_styles = Document(BytesIO(_BLANK_DOCX_BYTES)).styles
+_DOCX_BULLET_STYLE_ID = _blank_styles["List Bullet"].style_id
+_DOCX_HEADING2_STYLE_ID = _blank_styles["Heading 2"].style_id
+del _blank_styles
+
+
+def _add_styled_paragraph(doc, style_id, text=None):
+    """
+    Same as doc.add_paragraph(text, style) but takes an already-resolved style id.
+    """
+    p = doc.add_paragraph(text)
+    p._p.style = style_id
+    return p
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def create_docx(top_image_bytes, model, bottom_image_bytes, headers, footers):
+    doc = Document(BytesIO(_BLANK_DOCX_BYTES))
     section = doc.sections[0]
-    
-    # Calculate content width (A4 width - margins)
-    content_width_inches = (A4[0] - 100) / 72  # Convert points to inches
+    content_width_inches = _DOCX_CONTENT_WIDTH_INCHES
 
     # Header (2 cells: left/right)
     header = section.header
@@ -361,44 +523,41 @@ def create_docx(top_image_file, intro_text, sections, contact_info, bottom_image
     f_para.add_run('\t' + (footers.get('bottom_right', '') or ''))
 
     # Top image
-    if top_image_file is not None:
+    if top_image_bytes is not None:
         p = doc.add_paragraph()
         run = p.add_run()
-        top_image_file.seek(0)
-        run.add_picture(top_image_file, width=Inches(content_width_inches), height=Inches(2))
+        top_io = BytesIO(top_image_bytes)
+        run.add_picture(top_io, width=Inches(content_width_inches), height=Inches(2))
 
     # Intro text
-    if intro_text:
+    if model.intro_text:
         p = doc.add_paragraph()
-        add_text_with_links(p, intro_text)
+        add_text_with_links(p, model.intro_text)
 
     # Sections
-    for sec in sections:
-        title = (sec.get("title") or "").strip()
-        content = (sec.get("content") or "").strip()
-        if title:
-            doc.add_heading(title, level=2)
-        for bullet in text_to_bullets(content):
-            p = doc.add_paragraph(style='List Bullet')
+    for sec in model.sections:
+        if sec.title:
+            _add_styled_paragraph(doc, _DOCX_HEADING2_STYLE_ID, sec.title)
+        for bullet in sec.bullets:
+            p = _add_styled_paragraph(doc, _DOCX_BULLET_STYLE_ID)
             add_text_with_links(p, bullet)
 
     # Contact info
-    if contact_info:
-        doc.add_heading("Contact Information", level=2)
+    if model.contact_info:
+        _add_styled_paragraph(doc, _DOCX_HEADING2_STYLE_ID, "Contact Information")
         p = doc.add_paragraph()
-        add_text_with_links(p, contact_info)
+        add_text_with_links(p, model.contact_info)
 
     # Bottom image
-    if bottom_image_file is not None:
+    if bottom_image_bytes is not None:
         p = doc.add_paragraph()
         run = p.add_run()
-        bottom_image_file.seek(0)
-        run.add_picture(bottom_image_file, width=Inches(content_width_inches), height=Inches(1))
+        bottom_io = BytesIO(bottom_image_bytes)
+        run.add_picture(bottom_io, width=Inches(content_width_inches), height=Inches(1))
 
     buf = BytesIO()
     doc.save(buf)
-    buf.seek(0)
-    return buf
+    return buf.getvalue()
 
 # =========================================================
 # Streamlit UI
@@ -416,8 +575,8 @@ with st.expander("Images"):
 
 st.subheader("Intro")
 intro_text = st.text_area("Intro text (links supported: [label](https://example.com))", height=120)
-intro_color_name = st.selectbox("Intro background color", list(COLOR_OPTIONS.keys()), index=0)
-intro_color = COLOR_OPTIONS[intro_color_name]
+intro_color_name = st.selectbox("Intro background color", _COLOR_NAMES, index=0)
+intro_color = _COLOR_RGB[intro_color_name]
 
 st.subheader("Sections")
 num_sections = st.number_input("How many sections?", min_value=1, max_value=10, value=3, step=1)
@@ -428,8 +587,8 @@ for i in range(int(num_sections)):
     content = st.text_area(
         f"Bullets {i+1} (one per line; links supported)", key=f"content_{i}", height=120
     )
-    color_name = st.selectbox(f"Section {i+1} background color", list(COLOR_OPTIONS.keys()), index=0, key=f"color_{i}")
-    sections.append({"title": title, "content": content, "color": COLOR_OPTIONS[color_name]})
+    color_name = st.selectbox(f"Section {i+1} background color", _COLOR_NAMES, index=0, key=f"color_{i}")
+    sections.append({"title": title, "content": content, "color": _COLOR_RGB[color_name]})
 
 st.subheader("Contact")
 contact_info = st.text_area("Contact info (links supported)", height=100)
@@ -453,22 +612,34 @@ if st.button("Generate PDF and DOCX"):
     headers = {"top_left": header_top_left, "top_right": header_top_right}
     footers = {"bottom_left": footer_bottom_left, "bottom_right": footer_bottom_right}
 
+    # Read and downscale each upload once; both generators share the small bytes
+    top_bytes = (
+        _downscale(top_image.getvalue(), _IMAGE_MAX_W_PX, 2 * _IMAGE_DPI)
+        if top_image is not None else None
+    )
+    bottom_bytes = (
+        _downscale(bottom_image.getvalue(), _IMAGE_MAX_W_PX, 1 * _IMAGE_DPI)
+        if bottom_image is not None else None
+    )
+
+    # Normalize text once for both formats. Colors stay outside the model because
+    # DOCX ignores them, so color changes don't invalidate its cache.
+    model = _prepare_newsletter_model(intro_text, sections, contact_info)
+    section_colors = tuple(sec["color"] for sec in sections)
+
     # Create PDF + DOCX
-    pdf_buffer = create_pdf(
-        top_image, intro_text, intro_color, sections, contact_info, bottom_image,
+    pdf_bytes = create_pdf(
+        top_bytes, model, intro_color, section_colors, bottom_bytes,
         headers, footers, confidentiality_line, add_watermark
     )
-    docx_buffer = create_docx(
-        top_image, intro_text, sections, contact_info, bottom_image,
-        headers, footers
-    )
+    docx_bytes = create_docx(top_bytes, model, bottom_bytes, headers, footers)
 
     st.success("✅ Newsletter generated successfully!")
     dl1, dl2 = st.columns(2)
     with dl1:
         st.download_button(
             "📄 Download PDF",
-            data=pdf_buffer,
+            data=pdf_bytes,
             file_name="newsletter.pdf",
             mime="application/pdf",
             use_container_width=True
@@ -476,7 +647,7 @@ if st.button("Generate PDF and DOCX"):
     with dl2:
         st.download_button(
             "📝 Download DOCX",
-            data=docx_buffer,
+            data=docx_bytes,
             file_name="newsletter.docx",
             mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             use_container_width=True